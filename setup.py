@@ -27,6 +27,9 @@ setup(
         "qtawesome",
         "spyder>=6",
     ],
+    extras_require={
+        "cache": ["msgpack", "zstandard"],
+    },
     packages=find_packages(),
     entry_points={
         "spyder.plugins": [
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+#
+# ----------------------------------------------------------------------------
+# Copyright © 2022, Spyder Development Team and spyder-env-manager contributors
+#
+# Licensed under the terms of the MIT license
+# ----------------------------------------------------------------------------
+
+"""
+Spyder Env Manager on-disk cache.
+
+Values are stored encoded with msgpack and compressed with zstandard, one file
+per key. Both packages are optional dependencies, if any of them is missing
+values are stored as JSON instead.
+
+Keys identify the data described (e.g. an environment directory), so storing
+a new value replaces the previous one. Values can be stored with a stamp (e.g.
+the modification time of the data they describe) and are only returned when
+read with the same stamp, so an outdated entry is just a cache miss.
+"""
+
+# Standard library imports
+import hashlib
+import json
+import logging
+import os
+import os.path as osp
+import tempfile
+
+# Third-party imports
+try:
+    import msgpack
+    import zstandard
+except ImportError:
+    msgpack = zstandard = None
+
+# Spyder imports
+from spyder.config.base import get_conf_path
+
+# Setup logger
+logger = logging.getLogger(__name__)
+
+# Constants
+COMPRESSED_CACHE = msgpack is not None and zstandard is not None
+CACHE_DIRNAME = "env_cache"
+CACHE_FILE_EXTENSION = ".msgpack.zst" if COMPRESSED_CACHE else ".json"
+
+
+def get_cache_dir():
+    """Get the directory where the cache files are stored."""
+    return get_conf_path(CACHE_DIRNAME)
+
+
+def get_cache_path(key):
+    """Get the path of the file storing the value of the given key."""
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+    return osp.join(get_cache_dir(), digest + CACHE_FILE_EXTENSION)
+
+
+def encode_value(value):
+    """Encode a value to be stored in a cache file."""
+    if COMPRESSED_CACHE:
+        return zstandard.ZstdCompressor().compress(msgpack.packb(value))
+    return json.dumps(value).encode("utf-8")
+
+
+def decode_value(data):
+    """Decode a value read from a cache file."""
+    if COMPRESSED_CACHE:
+        return msgpack.unpackb(zstandard.ZstdDecompressor().decompress(data))
+    return json.loads(data.decode("utf-8"))
+
+
+def cache_get(key, stamp=None):
+    """
+    Get the value stored in the cache for the given key.
+
+    Parameters
+    ----------
+    key : str
+        Cache key.
+    stamp : object, optional
+        Stamp the value needs to have been stored with. Values stored with a
+        different stamp are considered not available. The default is None.
+
+    Returns
+    -------
+    object
+        The cached value or None if the key is not available in the cache.
+    """
+    try:
+        with open(get_cache_path(key), "rb") as cache_file:
+            entry = decode_value(cache_file.read())
+    except FileNotFoundError:
+        return None
+    except Exception:
+        logger.debug(f"Unable to read cache key: {key}", exc_info=True)
+        return None
+
+    if not isinstance(entry, dict) or entry.get("stamp") != stamp:
+        return None
+    return entry.get("value")
+
+
+def cache_put(key, value, stamp=None):
+    """
+    Store a value in the cache, replacing the one stored for the same key.
+
+    Parameters
+    ----------
+    key : str
+        Cache key.
+    value : object
+        Value to store. It needs to be serializable by msgpack and JSON.
+    stamp : object, optional
+        Stamp needed to get the value back (see `cache_get`). It needs to be
+        serializable by msgpack and JSON. The default is None.
+
+    Returns
+    -------
+    None.
+    """
+    cache_path = get_cache_path(key)
+    temp_path = None
+    try:
+        data = encode_value({"stamp": stamp, "value": value})
+        os.makedirs(osp.dirname(cache_path), exist_ok=True)
+
+        # Write to a temporary file first so readers never see partial entries
+        fd, temp_path = tempfile.mkstemp(dir=osp.dirname(cache_path))
+        with os.fdopen(fd, "wb") as cache_file:
+            cache_file.write(data)
+        os.replace(temp_path, cache_path)
+    except Exception:
+        logger.debug(f"Unable to write cache key: {key}", exc_info=True)
+        if temp_path is not None:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+
+def cache_delete(key):
+    """
+    Remove the value stored in the cache for the given key, if any.
+
+    Parameters
+    ----------
+    key : str
+        Cache key.
+
+    Returns
+    -------
+    None.
+    """
+    try:
+        os.remove(get_cache_path(key))
+    except FileNotFoundError:
+        pass
+    except Exception:
+        logger.debug(f"Unable to delete cache key: {key}", exc_info=True)
@@ -80,6 +80,7 @@ class SpyderEnvManager(SpyderDockablePlugin):
         main_widget.sig_set_spyder_custom_interpreter.connect(
             self.sig_set_spyder_custom_interpreter
         )
+        main_widget.sig_status_message.connect(self.sig_status_message_requested)
 
     @on_plugin_available(plugin=Plugins.Preferences)
     def on_preferences_available(self):
@@ -13,7 +13,7 @@ import os.path as osp
 # Third party imports
 import requests
 from qtpy.compat import getopenfilename, getsavefilename
-from qtpy.QtCore import QRegularExpression, Qt, Signal
+from qtpy.QtCore import QRegularExpression, QSignalBlocker, Qt, Signal
 from qtpy.QtGui import QRegularExpressionValidator
 from qtpy.QtWidgets import (
     QComboBox,
@@ -61,6 +61,7 @@ class CustomParametersDialog(QDialog):
         self.setWindowTitle(title)
         self.setModal(True)
         self.lineedits = {}
+        self.types = types
 
         glayout = QGridLayout()
         glayout.setContentsMargins(0, 0, 0, 0)
@@ -150,6 +151,43 @@ class CustomParametersDialog(QDialog):
         layout.addLayout(btnlayout)
         self.setLayout(layout)
 
+        # The dialog isn't resizable. Keep its initial size unless its
+        # contents need more space
+        self.setFixedSize(self.size().expandedTo(self.sizeHint()))
+
+    def reset(self, contents):
+        """
+        Restore the dialog fields to their initial state so it can be reused.
+
+        Parameters
+        ----------
+        contents : list[iterable]
+            Initial values of the dialog fields, as given when creating it.
+
+        Returns
+        -------
+        None.
+        """
+        for idx, widget_type in enumerate(self.types):
+            if widget_type == CustomParametersDialogWidgets.ComboBox:
+                self.combobox.setCurrentIndex(0)
+            elif widget_type == CustomParametersDialogWidgets.ComboBoxEdit:
+                # Avoid validating the initial value again
+                signal_blocker = QSignalBlocker(self.combobox_edit)
+                self.combobox_edit.setCurrentIndex(0)
+                self.combobox_edit.setEditText(self.combobox_edit.itemText(0))
+                signal_blocker.unblock()
+            elif widget_type == CustomParametersDialogWidgets.LineEditVersion:
+                self.lineedit_version.clear()
+            elif widget_type == CustomParametersDialogWidgets.Label:
+                self.line_string.setText(list(contents[idx])[0])
+            elif widget_type == CustomParametersDialogWidgets.LineEditString:
+                self.lineedit_string.clear()
+            elif widget_type == CustomParametersDialogWidgets.ComboBoxFile:
+                self.file_combobox.combobox.setEditText("")
+            elif widget_type == CustomParametersDialogWidgets.LineEditFile:
+                self.file_lineedit.lineedit.clear()
+
     def validate(self, qstr, editing=True):
         """Validate entered path
         if self.comboBox.selected_text == qstr and qstr != '':
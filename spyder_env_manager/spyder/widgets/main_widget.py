@@ -11,27 +11,31 @@ Spyder env manager Main Plugin Widget.
 """
 
 # Standard library imports
+from functools import lru_cache, partial
 import os
 import os.path as osp
 from pathlib import Path
 from string import Template
+import time
 
 # Third party imports
 from envs_manager.backends.conda_like_interface import CondaLikeInterface
 from envs_manager.manager import DEFAULT_BACKENDS_ROOT_PATH, Manager
 import qtawesome as qta
-from qtpy.QtCore import QThread, QUrl, Signal
-from qtpy.QtGui import QColor
-from qtpy.QtWebEngineWidgets import WEBENGINE, QWebEnginePage
+from qtpy.QtCore import QSignalBlocker, Qt, QThread, QTimer, Signal
+from qtpy.QtGui import QStandardItem, QStandardItemModel, QTextDocumentFragment
 from qtpy.QtWidgets import (
+    QActionGroup,
     QComboBox,
     QDialog,
     QMessageBox,
     QSizePolicy,
-    QStackedLayout,
+    QTextBrowser,
+    QVBoxLayout,
 )
 
 # Spyder and local imports
+from spyder.api.config.decorators import on_conf_change
 from spyder.api.translations import get_translation
 from spyder.api.widgets.main_widget import (
     PluginMainWidget,
@@ -41,12 +45,16 @@ from spyder.config.base import get_module_source_path
 from spyder.dependencies import SPYDER_KERNELS_REQVER
 from spyder.utils.icon_manager import ima
 from spyder.utils.palette import QStylePalette
-from spyder.widgets.browser import FrameWebView
 
+from spyder_env_manager.spyder.cache import cache_delete, cache_get, cache_put
 from spyder_env_manager.spyder.config import (
     conda_like_executable,
 )
-from spyder_env_manager.spyder.workers import EnvironmentManagerWorker
+from spyder_env_manager.spyder.workers import (
+    EnvironmentJobRunner,
+    list_environments,
+    list_packages,
+)
 from spyder_env_manager.spyder.widgets.helper_widgets import (
     CustomParametersDialog,
     CustomParametersDialogWidgets,
@@ -64,18 +72,58 @@ _ = get_translation("spyder")
 # ---- Constants
 # =============================================================================
 PLUGINS_PATH = get_module_source_path("spyder", "plugins")
-TEMPLATES_PATH = Path(__file__) / "spyder" / "assets" / "templates"
+TEMPLATES_PATH = Path(__file__).resolve().parents[2] / "spyder" / "assets" / "templates"
 MAIN_BG_COLOR = QStylePalette.COLOR_BACKGROUND_1
-separador = osp.sep
-ENVIRONMENT_MESSAGE = Path(
-    separador.join(osp.dirname(os.path.abspath(__file__)).split(separador)[:-2]),
-    "spyder",
-    "assets",
-    "templates",
-    "environment_info.html",
-)
+ENVIRONMENT_MESSAGE = TEMPLATES_PATH / "environment_info.html"
 CSS_PATH = Path(PLUGINS_PATH) / "help" / "utils" / "static" / "css"
 SPYDER_KERNELS_VERSION = SPYDER_KERNELS_REQVER.split(";")[0]
+# Time to wait before handling a change of the selected environment (in ms)
+ENVIRONMENT_CHANGE_DELAY = 150
+# Time to wait before filtering the packages again after a toggle (in ms)
+PACKAGES_FILTER_DELAY = 50
+# Time to wait for the running action when closing (in ms)
+ACTIONS_THREAD_STOP_TIMEOUT = 2000
+# Time to show messages in the status bar (in ms)
+STATUS_MESSAGE_TIMEOUT = 5000
+# Time after which the cached environments are listed again (in s)
+ENVIRONMENTS_CACHE_MAX_AGE = 24 * 60 * 60
+# Minimum number of characters shown by the environments combobox
+ENVIRONMENT_NAME_MIN_LENGTH = 24
+
+# Introduction message shown when there are no environments
+INTRO_MESSAGE = _(
+    "Click "
+    "<span title='New environment' style='border : 0.5px solid #c0c0c0;'>"
+    "&#xFF0B;</span> to create a new environment or to import an environment"
+    " definition from a file, click the "
+    "<span title='Options' style='border : 1px solid #c0c0c0;'>"
+    "&#9776;</span> button on the top right too."
+)
+
+# Options menu actions whose tip is the same as their text
+IMPORT_ENVIRONMENT_TEXT = _("Import environment from file (.yml, .txt)")
+EXPORT_ENVIRONMENT_TEXT = _("Export environment to file (.yml, .txt)")
+EXCLUDE_DEPENDENCY_TEXT = _("Exclude dependency packages")
+
+# Environment creation failures (shown in the status bar)
+ENVIRONMENT_CREATION_ERROR_MESSAGE = _("Environment creation failed: {error}")
+
+# Package actions dialogs
+UPDATE_PACKAGE_MESSAGE = _("Are you sure you want to update <tt>{package_name}</tt>?")
+UNINSTALL_PACKAGE_MESSAGE = _(
+    "Are you sure you want to uninstall <tt>{package_name}</tt>?"
+)
+PACKAGE_CONSTRAINTS = ("==", "<=", ">=", "<", ">", "latest")
+
+# Environment dialogs
+ENVIRONMENT_MANAGERS = ("conda-like",)
+PYTHON_VERSIONS = ("3.8.16", "3.9.16", "3.10.9", "3.11.0")
+PACKAGE_VERSION_MESSAGES = ("Package", "Constraint", "Version")
+PACKAGE_VERSION_TYPES = (
+    CustomParametersDialogWidgets.Label,
+    CustomParametersDialogWidgets.ComboBox,
+    CustomParametersDialogWidgets.LineEditVersion,
+)
 
 
 class SpyderEnvManagerWidgetActions:
@@ -84,6 +132,7 @@ class SpyderEnvManagerWidgetActions:
     NewEnvironment = "new_environment"
     DeleteEnvironment = "delete_environment"
     InstallPackage = "install_package"
+    ListEnvironments = "list_environments"
     ListPackages = "list_packages"
 
     # Options menu actions
@@ -91,6 +140,7 @@ class SpyderEnvManagerWidgetActions:
     ExportEnvironment = "export_environment_action"
     ToggleExcludeDependency = "exclude_dependency_action"
     ToggleEnvironmentAsCustomInterpreter = "environment_as_custom_interpreter"
+    RefreshEnvironments = "refresh_environments_action"
 
 
 class SpyderEnvManagerWidgetOptionsMenuSections:
@@ -102,6 +152,88 @@ class SpyderEnvManagerWidgetMainToolBarSections:
     Main = "main_section"
 
 
+# =============================================================================
+# ---- Functions
+# =============================================================================
+@lru_cache(maxsize=1)
+def get_environment_message_template(mtime=None):
+    """
+    Get the environment message template.
+
+    It's only read and compiled again when a different modification time of
+    the template file is given.
+    """
+    with open(ENVIRONMENT_MESSAGE) as template_message:
+        return Template(template_message.read())
+
+
+@lru_cache(maxsize=8)
+def render_environment_message(css_path, title, message, mtime=None):
+    """Render the environment message template with the given values."""
+    return get_environment_message_template(mtime).substitute(
+        css_path=css_path, title=title, message=message
+    )
+
+
+def to_plain_text(message):
+    """
+    Convert a rich text message to plain text in a single line.
+
+    Parameters
+    ----------
+    message : object
+        Message to convert. It can contain HTML.
+
+    Returns
+    -------
+    str
+        The message text without markup or line breaks.
+    """
+    text = QTextDocumentFragment.fromHtml(str(message)).toPlainText()
+    return " ".join(text.split())
+
+
+def stop_thread(thread, timeout=ACTIONS_THREAD_STOP_TIMEOUT):
+    """
+    Stop a thread, giving its running work (if any) some time to finish.
+
+    Parameters
+    ----------
+    thread : QThread
+        Thread to stop.
+    timeout : int, optional
+        Time to wait for the thread to finish (in ms). The default is
+        ACTIONS_THREAD_STOP_TIMEOUT.
+
+    Returns
+    -------
+    None.
+    """
+    if not thread.isRunning():
+        return
+    thread.quit()
+    if not thread.wait(timeout):
+        thread.terminate()
+        thread.wait()
+
+
+@lru_cache(maxsize=None)
+def get_qta_icon(name, color, rotated=0):
+    """
+    Get a QtAwesome icon.
+
+    Icons are rendered only the first time they are requested with the same
+    arguments.
+    """
+    return qta.icon(name, color=color, rotated=rotated)
+
+
+@lru_cache(maxsize=None)
+def get_spyder_icon(name):
+    """Get a Spyder icon, creating it only the first time it's requested."""
+    return ima.icon(name)
+
+
 # =============================================================================
 # ---- Widgets
 # =============================================================================
@@ -112,6 +244,7 @@ class SpyderEnvManagerWidget(PluginMainWidget):
     # --- PluginMainWidget class constants
     ENABLE_SPINNER = True
     NO_ENVIRONMENTS_AVAILABLE = _("No environments available")
+    LOADING_ENVIRONMENTS = _("Loading environments...")
 
     # --- Signals
     sig_set_spyder_custom_interpreter = Signal(str, str)
@@ -127,196 +260,368 @@ class SpyderEnvManagerWidget(PluginMainWidget):
         Path to the environment Python interpreter.
     """
 
+    sig_status_message = Signal(str, int)
+    """
+    Signal to request showing a message in Spyder's status bar.
+
+    Parameters
+    ----------
+    message: str
+        Message to show.
+    timeout: int
+        Time to show the message for (in ms).
+    """
+
     def __init__(self, name, plugin, parent=None):
         super().__init__(name, plugin, parent=parent)
 
         # General attributes
         self.actions_enabled = True
         self.exclude_non_requested_packages = True
+
+        # Environment manager actions run one at a time in a single thread
+        # that lives as long as the widget
+        self._last_job_id = 0
         self.env_manager_action_thread = QThread(None)
-        self.manager_worker = None
+        self._job_runner = EnvironmentJobRunner()
+        self._job_runner.moveToThread(self.env_manager_action_thread)
+        self._job_runner.sig_ready.connect(self._on_manager_action_ready)
+        self.env_manager_action_thread.start()
 
-        # Select environment widget
-        root_path = self.get_conf("environments_path")
-        envs, _ = Manager.list_environments(
-            backend=CondaLikeInterface.ID,
-            root_path=root_path,
-            external_executable=self.get_conf("conda_file_executable_path"),
+        # The thread has no parent, so make sure it's stopped even if the
+        # widget is destroyed without being closed
+        self.destroyed.connect(partial(stop_thread, self.env_manager_action_thread))
+        # Actions disabled while an action is running. Only the ones that
+        # need an environment are handled individually.
+        self._mutable_actions = QActionGroup(self)
+        self._mutable_actions.setExclusive(False)
+        self._env_dependent_actions = []
+        self._env_dependent_action_ids = frozenset(
+            [
+                SpyderEnvManagerWidgetActions.InstallPackage,
+                SpyderEnvManagerWidgetActions.DeleteEnvironment,
+                SpyderEnvManagerWidgetActions.ExportEnvironment,
+                SpyderEnvManagerWidgetActions.ToggleExcludeDependency,
+                SpyderEnvManagerWidgetActions.ToggleEnvironmentAsCustomInterpreter,
+            ]
+        )
+
+        # Config options used by the environment manager actions
+        self._backend = "conda-like"
+        self._root_path = Path(self.get_conf("environments_path"))
+        self._external_executable = self.get_conf("conda_file_executable_path")
+        self._environment_as_custom_interpreter_enabled = self.get_conf(
+            SpyderEnvManagerWidgetActions.ToggleEnvironmentAsCustomInterpreter
         )
+        self._managers_by_dir = {}
+
+        # Environments available by name. It's kept up to date when
+        # environments are added or removed, so the environments only need to
+        # be listed again on an explicit refresh.
+        # If they aren't cached, they're listed in the actions thread once the
+        # widget is set up (see _load_environments).
+        # Time (in s since the epoch) when the environments were last listed
+        self._envs_listed_at = None
+        self.envs = None
+        envs_cache_stamp = self._get_environments_cache_stamp()
+        envs_cache_entry = (
+            cache_get(self._get_environments_cache_key(), stamp=envs_cache_stamp)
+            if envs_cache_stamp is not None
+            else None
+        )
+        listed_at = envs_cache_entry.get("listed_at") if envs_cache_entry else None
+        if (
+            listed_at is not None
+            and time.time() - listed_at <= ENVIRONMENTS_CACHE_MAX_AGE
+        ):
+            self.envs = envs_cache_entry["envs"]
+            self._envs_listed_at = listed_at
+        self._envs_loading = self.envs is None
+        if self._envs_loading:
+            self.envs = {}
+
+        # Select environment widget
         self.select_environment = QComboBox(self)
         self.select_environment.ID = SpyderEnvManagerWidgetActions.SelectEnvironment
-        if not envs:
-            self.envs_available = False
-            self.select_environment.addItem(self.NO_ENVIRONMENTS_AVAILABLE, None)
-        else:
-            for env_name, env_directory in envs.items():
-                self.select_environment.addItem(env_name, env_directory)
-            self.envs_available = True
-        self.select_environment.setToolTip("Select an environment")
+        # Use a fixed minimum width so the size hint doesn't depend on the
+        # width of every item
         self.select_environment.setSizeAdjustPolicy(
-            QComboBox.AdjustToMinimumContentsLength
+            QComboBox.AdjustToMinimumContentsLengthWithIcon
         )
+        self.select_environment.setMinimumContentsLength(ENVIRONMENT_NAME_MIN_LENGTH)
+        # All the items have the same height, so the popup doesn't need to
+        # measure each of them
+        self.select_environment.view().setUniformItemSizes(True)
+        self._populate_environments(self.get_conf("selected_environment"))
+        self.select_environment.setToolTip("Select an environment")
         self.select_environment.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-        selected_environment = self.get_conf("selected_environment")
-        if selected_environment:
-            self.select_environment.setCurrentText(selected_environment)
 
         # Usage widget
+        # It's only created when needed (see _ensure_infowidget)
         self.css_path = self.get_conf("css_path", str(CSS_PATH), "appearance")
-        self.infowidget = FrameWebView(self)
-        if WEBENGINE:
-            self.infowidget.web_widget.page().setBackgroundColor(QColor(MAIN_BG_COLOR))
-        else:
-            self.infowidget.web_widget.setStyleSheet(
-                "background:{}".format(MAIN_BG_COLOR)
-            )
-            self.infowidget.page().setLinkDelegationPolicy(
-                QWebEnginePage.DelegateAllLinks
-            )
+        self.infowidget = None
+        self._intro_rendered = False
+        self._rich_font = None
 
         # Package table widget
         self.packages_table = EnvironmentPackagesTable(self)
 
         # Layout
-        self.stack_layout = layout = QStackedLayout()
-        layout.addWidget(self.infowidget)
+        # Only one of the widgets is visible at a time (see
+        # current_environment_changed)
+        self.content_layout = layout = QVBoxLayout()
         layout.addWidget(self.packages_table)
-        self.setLayout(self.stack_layout)
+        self.setLayout(self.content_layout)
+
+        # Dialogs being shown (see _open_dialog) and dialogs kept to be reused
+        # by action
+        self._active_dialogs = set()
+        self._dialog_cache = {}
+        self._error_box = None
+
+        # Actions whose failures are reported in the status bar instead of
+        # with an error dialog
+        self._status_bar_error_action_ids = frozenset(
+            [
+                SpyderEnvManagerWidgetActions.NewEnvironment,
+                SpyderEnvManagerWidgetActions.ImportEnvironment,
+            ]
+        )
+
+        # Handlers of the successful environment manager actions results
+        self._after_action_handlers = {
+            SpyderEnvManagerWidgetActions.NewEnvironment: (
+                self._add_new_environment_entry
+            ),
+            SpyderEnvManagerWidgetActions.ImportEnvironment: (
+                self._after_import_environment
+            ),
+            SpyderEnvManagerWidgetActions.ExportEnvironment: (
+                self._after_export_environment
+            ),
+            SpyderEnvManagerWidgetActions.DeleteEnvironment: (
+                self._after_delete_environment
+            ),
+            SpyderEnvManagerWidgetActions.ListEnvironments: (
+                self._after_list_environments
+            ),
+            SpyderEnvManagerWidgetActions.ListPackages: (
+                self._after_list_environment_packages
+            ),
+            SpyderEnvManagerWidgetActions.InstallPackage: self._after_package_changed,
+            EnvironmentPackagesActions.UpdatePackage: self._after_package_changed,
+            EnvironmentPackagesActions.UninstallPackage: self._after_package_changed,
+            EnvironmentPackagesActions.InstallPackageVersion: (
+                self._after_package_changed
+            ),
+        }
+
+        # Timer to handle bursts of environment changes only once
+        self._env_change_timer = QTimer(self)
+        self._env_change_timer.setSingleShot(True)
+        self._env_change_timer.setInterval(ENVIRONMENT_CHANGE_DELAY)
+        self._env_change_timer.timeout.connect(self.current_environment_changed)
+
+        # Timer to filter the packages only once after rapid toggles
+        self._packages_filter_timer = QTimer(self)
+        self._packages_filter_timer.setSingleShot(True)
+        self._packages_filter_timer.setInterval(PACKAGES_FILTER_DELAY)
+        self._packages_filter_timer.timeout.connect(
+            lambda: self.packages_table.load_packages(
+                self.exclude_non_requested_packages
+            )
+        )
 
         # Signals
         self.packages_table.sig_action_context_menu.connect(
             self._handle_package_table_context_menu_actions
         )
         self.select_environment.currentIndexChanged.connect(
-            self.current_environment_changed
+            lambda index: self._env_change_timer.start()
         )
 
+    @property
+    def envs_available(self):
+        """Whether there are environments available."""
+        return bool(self.envs)
+
     # ---- PluginMainWidget API
     # ------------------------------------------------------------------------
     def get_title(self):
         return _("Spyder Env Manager")
 
     def setup(self):
-        # ---- Options menu actions
-        import_environment_action = self.create_action(
-            SpyderEnvManagerWidgetActions.ImportEnvironment,
-            text=_("Import environment from file (.yml, .txt)"),
-            tip=_("Import environment from file (.yml, .txt)"),
-            triggered=self._message_import_environment,
-        )
-
-        export_environment_action = self.create_action(
-            SpyderEnvManagerWidgetActions.ExportEnvironment,
-            text=_("Export environment to file (.yml, .txt)"),
-            tip=_("Export environment to file (.yml, .txt)"),
-            triggered=self._message_export_environment,
+        import_export_section = SpyderEnvManagerWidgetOptionsMenuSections.ImportExport
+        advanced_section = SpyderEnvManagerWidgetOptionsMenuSections.AdvancedOptions
+        interpreter_option = (
+            SpyderEnvManagerWidgetActions.ToggleEnvironmentAsCustomInterpreter
         )
 
-        exclude_dependency_action = self.create_action(
-            SpyderEnvManagerWidgetActions.ToggleExcludeDependency,
-            text=_("Exclude dependency packages"),
-            tip=_("Exclude dependency packages"),
-            toggled=True,
-            triggered=self.update_packages,
-            option=SpyderEnvManagerWidgetActions.ToggleExcludeDependency,
-            initial=self.get_conf(
-                SpyderEnvManagerWidgetActions.ToggleExcludeDependency,
+        # ---- Options menu actions, as (section, create_action kwargs)
+        options_menu_specs = [
+            (
+                import_export_section,
+                dict(
+                    name=SpyderEnvManagerWidgetActions.ImportEnvironment,
+                    text=IMPORT_ENVIRONMENT_TEXT,
+                    tip=IMPORT_ENVIRONMENT_TEXT,
+                    triggered=self._message_import_environment,
+                ),
             ),
-        )
-
-        environment_as_custom_interpreter_action = self.create_action(
-            SpyderEnvManagerWidgetActions.ToggleEnvironmentAsCustomInterpreter,
-            text=_("Set current environment as Spyder's Python interpreter"),
-            tip=_(
-                "Set the current environment Python interpreter as "
-                "the interpreter used by Spyder"
+            (
+                import_export_section,
+                dict(
+                    name=SpyderEnvManagerWidgetActions.ExportEnvironment,
+                    text=EXPORT_ENVIRONMENT_TEXT,
+                    tip=EXPORT_ENVIRONMENT_TEXT,
+                    triggered=self._message_export_environment,
+                ),
             ),
-            toggled=True,
-            triggered=lambda: self._environment_as_custom_interpreter(),
-            option=SpyderEnvManagerWidgetActions.ToggleEnvironmentAsCustomInterpreter,
-            initial=self.get_conf(
-                SpyderEnvManagerWidgetActions.ToggleEnvironmentAsCustomInterpreter,
+            (
+                advanced_section,
+                dict(
+                    name=SpyderEnvManagerWidgetActions.ToggleExcludeDependency,
+                    text=EXCLUDE_DEPENDENCY_TEXT,
+                    tip=EXCLUDE_DEPENDENCY_TEXT,
+                    toggled=True,
+                    triggered=self._exclude_dependency_toggled,
+                    option=SpyderEnvManagerWidgetActions.ToggleExcludeDependency,
+                    initial=self.get_conf(
+                        SpyderEnvManagerWidgetActions.ToggleExcludeDependency,
+                    ),
+                ),
             ),
-        )
-
-        # ---- Toolbar actions
-        new_environment_action = self.create_action(
-            SpyderEnvManagerWidgetActions.NewEnvironment,
-            text=_("New environment"),
-            icon=qta.icon("mdi.plus", color=ima.MAIN_FG_COLOR, rotated=270),
-            triggered=self._message_new_environment,
-        )
+            (
+                advanced_section,
+                dict(
+                    name=interpreter_option,
+                    text=_("Set current environment as Spyder's Python interpreter"),
+                    tip=_(
+                        "Set the current environment Python interpreter as "
+                        "the interpreter used by Spyder"
+                    ),
+                    toggled=True,
+                    option=interpreter_option,
+                    initial=self.get_conf(interpreter_option),
+                ),
+            ),
+            (
+                advanced_section,
+                dict(
+                    name=SpyderEnvManagerWidgetActions.RefreshEnvironments,
+                    text=_("Refresh environments list"),
+                    tip=_("Look again for the environments available"),
+                    triggered=self._refresh_envs,
+                ),
+            ),
+        ]
 
-        delete_environment_action = self.create_action(
-            SpyderEnvManagerWidgetActions.DeleteEnvironment,
-            text=_("Delete environment"),
-            icon=self.create_icon("editclear"),
-            triggered=self._message_delete_environment,
-        )
+        # ---- Toolbar actions, in the order they are shown
+        toolbar_specs = [
+            dict(
+                name=SpyderEnvManagerWidgetActions.NewEnvironment,
+                text=_("New environment"),
+                icon=get_qta_icon("mdi.plus", ima.MAIN_FG_COLOR, rotated=270),
+                triggered=self._message_new_environment,
+            ),
+            dict(
+                name=SpyderEnvManagerWidgetActions.InstallPackage,
+                text=_("Install package"),
+                icon=get_qta_icon("mdi.view-grid-plus-outline", ima.MAIN_FG_COLOR),
+                # mdi.toy-brick-plus-outline
+                triggered=self._message_install_package,
+            ),
+            dict(
+                name=SpyderEnvManagerWidgetActions.DeleteEnvironment,
+                text=_("Delete environment"),
+                icon=get_spyder_icon("editclear"),
+                triggered=self._message_delete_environment,
+            ),
+        ]
 
-        install_package_action = self.create_action(
-            SpyderEnvManagerWidgetActions.InstallPackage,
-            text=_("Install package"),
-            icon=qta.icon("mdi.view-grid-plus-outline", color=ima.MAIN_FG_COLOR),
-            # mdi.toy-brick-plus-outline
-            triggered=self._message_install_package,
-        )
+        # Create all the actions first, so menus and toolbar are filled in
+        # a single pass afterwards
+        options_menu_items = [
+            (section, self.create_action(**kwargs))
+            for section, kwargs in options_menu_specs
+        ]
+        toolbar_items = [self.select_environment] + [
+            self.create_action(**kwargs) for kwargs in toolbar_specs
+        ]
 
         # Options menu
         options_menu = self.get_options_menu()
-        for item in [import_environment_action, export_environment_action]:
-            self.add_item_to_menu(
-                item,
-                menu=options_menu,
-                section=SpyderEnvManagerWidgetOptionsMenuSections.ImportExport,
-            )
-
-        for item in [
-            exclude_dependency_action,
-            environment_as_custom_interpreter_action,
-        ]:
-            self.add_item_to_menu(
-                item,
-                menu=options_menu,
-                section=SpyderEnvManagerWidgetOptionsMenuSections.AdvancedOptions,
-            )
+        for section, item in options_menu_items:
+            self.add_item_to_menu(item, menu=options_menu, section=section)
 
         # Main toolbar
         main_toolbar = self.get_main_toolbar()
-
-        for item in [
-            self.select_environment,
-            new_environment_action,
-            install_package_action,
-            delete_environment_action,
-        ]:
+        main_toolbar.setUpdatesEnabled(False)
+        for item in toolbar_items:
             self.add_item_to_toolbar(
                 item,
                 toolbar=main_toolbar,
                 section=SpyderEnvManagerWidgetMainToolBarSections.Main,
             )
+        main_toolbar.setUpdatesEnabled(True)
 
-        self.show_intro_message()
-        self.current_environment_changed()
+        # Actions enabled/disabled while an action is running
+        builtin_action_ids = set(PluginMainWidgetActions.__dict__.values())
+        for action_id, action in self.get_actions().items():
+            if action_id in builtin_action_ids:
+                continue
+            self._mutable_actions.addAction(action)
+            if action_id in self._env_dependent_action_ids:
+                self._env_dependent_actions.append(action)
+
+        if self._envs_loading:
+            self._load_environments()
+        else:
+            self.current_environment_changed()
 
     def show_intro_message(self):
         """Show introduction message on how to use the plugin."""
-        intro_message_eq = _(
-            "Click "
-            "<span title='New environment' style='border : 0.5px solid #c0c0c0;'>"
-            "&#xFF0B;</span> to create a new environment or to import an environment"
-            " definition from a file, click the "
-            "<span title='Options' style='border : 1px solid #c0c0c0;'>"
-            "&#9776;</span> button on the top right too."
-        )
+        self._ensure_infowidget()
+
+        # The message only needs to be rendered again if its style changes
+        if self._intro_rendered:
+            return
         self.mainMessage = self._create_info_environment_page(
-            title="Usage", message=intro_message_eq
+            title="Usage", message=INTRO_MESSAGE
         )
-        self.infowidget.setHtml(self.mainMessage, QUrl.fromLocalFile(self.css_path))
+        self.infowidget.setHtml(self.mainMessage)
+        self._intro_rendered = True
 
     def update_font(self, rich_font):
         self._rich_font = rich_font
-        self.infowidget.set_font(rich_font)
+        if self.infowidget is not None:
+            self.infowidget.setFont(rich_font)
+
+    @on_conf_change(option="css_path", section="appearance")
+    def on_css_path_change(self, value):
+        self.css_path = value
+        if self.infowidget is not None:
+            self._load_infowidget_stylesheet()
+            self._intro_rendered = False
+            if self.infowidget.isVisible():
+                self.show_intro_message()
+
+    @on_conf_change(option="environments_path")
+    def on_environments_path_change(self, value):
+        self._root_path = Path(value)
+
+    @on_conf_change(option="conda_file_executable_path")
+    def on_conda_file_executable_path_change(self, value):
+        self._external_executable = value
+        self._managers_by_dir.clear()
+
+    @on_conf_change(
+        option=SpyderEnvManagerWidgetActions.ToggleEnvironmentAsCustomInterpreter
+    )
+    def on_environment_as_custom_interpreter_change(self, value):
+        # The action toggle is handled here, once the option is already saved
+        self._environment_as_custom_interpreter_enabled = value
+        self._environment_as_custom_interpreter()
 
     def current_environment_changed(self, index=None):
         """
@@ -335,78 +640,139 @@ class SpyderEnvManagerWidget(PluginMainWidget):
         None.
 
         """
-        if index:
-            current_environment_path = self.select_environment.itemData(index)
-        else:
-            current_environment_path = self.select_environment.currentData()
-        environments_available = current_environment_path is not None
-        if environments_available:
+        # Nothing to show until the environments are listed
+        if self._envs_loading:
+            return
+
+        if self.envs_available:
+            if index:
+                current_environment_path = self.select_environment.itemData(index)
+            else:
+                current_environment_path = self.select_environment.currentData()
+
+            # Show the last known packages while they are listed again
+            cached_packages = self._get_cached_packages(current_environment_path)
+            if cached_packages is not None:
+                self.packages_table.load_packages(
+                    self.exclude_non_requested_packages, cached_packages
+                )
             self.start_spinner()
             self._run_action_for_env(
                 dialog=None, action=SpyderEnvManagerWidgetActions.ListPackages
             )
-            self.stack_layout.setCurrentWidget(self.packages_table)
-            if self.get_conf(
-                SpyderEnvManagerWidgetActions.ToggleEnvironmentAsCustomInterpreter,
-            ):
+            if self.infowidget is not None:
+                self.infowidget.setVisible(False)
+            self.packages_table.setVisible(True)
+            if self._environment_as_custom_interpreter_enabled:
                 self._environment_as_custom_interpreter(
                     environment_path=current_environment_path
                 )
         else:
-            self.stack_layout.setCurrentWidget(self.infowidget)
+            self.packages_table.setVisible(False)
+            self.show_intro_message()
+            self.infowidget.setVisible(True)
             self.stop_spinner()
 
     def update_actions(self):
         if self.actions_enabled:
-            current_environment_path = self.select_environment.currentData()
-            environments_available = current_environment_path is not None
-            actions_ids = [
-                SpyderEnvManagerWidgetActions.InstallPackage,
-                SpyderEnvManagerWidgetActions.DeleteEnvironment,
-                SpyderEnvManagerWidgetActions.ExportEnvironment,
-                SpyderEnvManagerWidgetActions.ToggleExcludeDependency,
-                SpyderEnvManagerWidgetActions.ToggleEnvironmentAsCustomInterpreter,
-            ]
-            for action_id, action in self.get_actions().items():
-                if action_id in actions_ids:
-                    action.setEnabled(environments_available)
-                else:
-                    action.setEnabled(True)
+            # Set the final state of the actions that need an environment
+            # before enabling the group. Explicitly disabled actions are kept
+            # disabled by the group, so no action is enabled just to be
+            # disabled again.
+            for action in self._env_dependent_actions:
+                action.setEnabled(self.envs_available)
+            self._mutable_actions.setEnabled(True)
 
     def update_packages(self, only_requested, packages=None):
         self.exclude_non_requested_packages = only_requested
+        self.packages_table.setUpdatesEnabled(False)
         self.packages_table.load_packages(only_requested, packages)
+        self.packages_table.setUpdatesEnabled(True)
         self.stop_spinner()
 
     def start_spinner(self):
         self.actions_enabled = False
-        for action_id, action in self.get_actions().items():
-            if action_id not in PluginMainWidgetActions.__dict__.values():
-                action.setEnabled(False)
+        # Repaint only once all the widgets are disabled
+        self.setUpdatesEnabled(False)
+        self._mutable_actions.setEnabled(False)
         self.select_environment.setDisabled(True)
         self.packages_table.setDisabled(True)
+        self.setUpdatesEnabled(True)
         super().start_spinner()
 
     def stop_spinner(self):
         self.actions_enabled = True
+        # Repaint only once all the widgets are enabled
+        self.setUpdatesEnabled(False)
         self.update_actions()
         self.select_environment.setDisabled(False)
         self.packages_table.setDisabled(False)
         super().stop_spinner()
+        self.setUpdatesEnabled(True)
 
     def on_close(self):
-        env_name = self.select_environment.currentText()
-        self.set_conf("selected_environment", env_name)
-        if (
-            self.env_manager_action_thread
-            and self.env_manager_action_thread.isRunning()
-        ):
-            self.env_manager_action_thread.terminate()
-            self.env_manager_action_thread.wait()
+        # Don't overwrite the last selected environment with a placeholder
+        if self.envs_available:
+            env_name = self.select_environment.currentText()
+            self.set_conf("selected_environment", env_name)
+
+        stop_thread(self.env_manager_action_thread)
+
+    def closeEvent(self, event):
+        """Qt Override."""
+        stop_thread(self.env_manager_action_thread)
+        super().closeEvent(event)
 
     # ---- Private API
     # ------------------------------------------------------------------------
 
+    def _ensure_infowidget(self):
+        """
+        Create the widget used to show the introduction message if needed.
+
+        Returns
+        -------
+        None.
+        """
+        if self.infowidget is not None:
+            return
+
+        # Only keep the widget once it's completely built, so it's created
+        # again next time if anything fails
+        infowidget = QTextBrowser(self)
+        infowidget.setOpenExternalLinks(True)
+        infowidget.setStyleSheet("background:{}".format(MAIN_BG_COLOR))
+        self._load_infowidget_stylesheet(infowidget)
+        if self._rich_font is not None:
+            infowidget.setFont(self._rich_font)
+        self.content_layout.insertWidget(0, infowidget)
+        self.infowidget = infowidget
+
+    def _load_infowidget_stylesheet(self, infowidget=None):
+        """
+        Set the stylesheet in `css_path` as the default one of the widget used
+        to show the introduction message.
+
+        Parameters
+        ----------
+        infowidget : QTextBrowser, optional
+            Widget to set the stylesheet to. The default is None, i.e. the
+            current `infowidget`.
+
+        Returns
+        -------
+        None.
+        """
+        if infowidget is None:
+            infowidget = self.infowidget
+        if not self.css_path:
+            return
+        try:
+            with open(Path(self.css_path) / "default.css") as css_file:
+                infowidget.document().setDefaultStyleSheet(css_file.read())
+        except OSError:
+            pass
+
     def _create_info_environment_page(self, title, message):
         """
         Create html page to describe the basic plugin functionality if no
@@ -424,12 +790,252 @@ class SpyderEnvManagerWidget(PluginMainWidget):
         page : str
             string representation of the page.
         """
-        with open(ENVIRONMENT_MESSAGE) as template_message:
-            environment_message_template = Template(template_message.read())
-            page = environment_message_template.substitute(
-                css_path=self.css_path, title=title, message=message
+        return render_environment_message(
+            self.css_path, title, message, osp.getmtime(ENVIRONMENT_MESSAGE)
+        )
+
+    def _load_environments(self):
+        """
+        List the environments available in the environments root path without
+        blocking the interface.
+
+        The environments are shown once they're listed (see
+        `_after_list_environments`).
+
+        Returns
+        -------
+        None.
+        """
+        self._envs_loading = True
+        self._run_env_manager_action(
+            SpyderEnvManagerWidgetActions.ListEnvironments,
+            None,
+            list_environments,
+            CondaLikeInterface.ID,
+            str(self._root_path),
+            self._external_executable,
+        )
+
+    def _cache_environments(self):
+        """
+        Store the environments available in the on-disk cache.
+
+        The time they were last listed is kept, so changes done from the
+        widget don't extend how long they're considered up to date.
+
+        Returns
+        -------
+        None.
+        """
+        envs_cache_stamp = self._get_environments_cache_stamp()
+        if envs_cache_stamp is not None:
+            cache_put(
+                self._get_environments_cache_key(),
+                {"listed_at": self._envs_listed_at, "envs": self.envs},
+                stamp=envs_cache_stamp,
+            )
+
+    def _exclude_dependency_toggled(self, value):
+        """Filter the packages again once the toggles have settled."""
+        self.exclude_non_requested_packages = value
+        self._packages_filter_timer.start()
+
+    def _populate_environments(self, current_env_name=None):
+        """
+        Fill the `select_environment` combobox with the available environments.
+
+        No change is notified by the combobox (see
+        `_notify_environment_changed`).
+
+        Parameters
+        ----------
+        current_env_name : str, optional
+            Name of the environment to select, if available. The default is
+            None.
+
+        Returns
+        -------
+        None.
+        """
+        # Build the model while it's not attached to the combobox, so its
+        # layout is only computed once. The previous model is owned by the
+        # combobox, so it's deleted when replaced.
+        model = QStandardItemModel(self.select_environment)
+        if self.envs:
+            for env_name, env_directory in self.envs.items():
+                model.appendRow(self._create_environment_item(env_name, env_directory))
+        elif self._envs_loading:
+            model.appendRow(self._create_environment_item(self.LOADING_ENVIRONMENTS))
+        else:
+            model.appendRow(
+                self._create_environment_item(self.NO_ENVIRONMENTS_AVAILABLE)
+            )
+
+        signal_blocker = QSignalBlocker(self.select_environment)
+        self.select_environment.setModel(model)
+        if self.envs and current_env_name:
+            self.select_environment.setCurrentText(current_env_name)
+        signal_blocker.unblock()
+        self.select_environment.updateGeometry()
+
+    def _create_environment_item(self, env_name, env_directory=None):
+        """
+        Create an item for the `select_environment` combobox model.
+
+        Parameters
+        ----------
+        env_name : str
+            Text of the item.
+        env_directory : str, optional
+            Environment directory, available as the item data. The default is
+            None.
+
+        Returns
+        -------
+        QStandardItem
+            The combobox item.
+        """
+        item = QStandardItem(env_name)
+        item.setData(env_directory, Qt.UserRole)
+        return item
+
+    def _refresh_envs(self):
+        """
+        List the available environments again and show them.
+
+        The current environment is kept selected if it's still available (see
+        `_after_list_environments`).
+
+        Returns
+        -------
+        None.
+        """
+        self._load_environments()
+
+    def _get_environment_to_select(self):
+        """
+        Get the name of the environment to select after repopulating the
+        `select_environment` combobox.
+
+        Returns
+        -------
+        str
+            The current environment if any, else the last one selected in a
+            previous session.
+        """
+        if self.select_environment.currentData():
+            return self.select_environment.currentText()
+        return self.get_conf("selected_environment")
+
+    def _notify_environment_changed(self):
+        """
+        Notify once that the current environment changed after changing the
+        `select_environment` combobox with its signals blocked.
+
+        Returns
+        -------
+        None.
+        """
+        self.select_environment.currentIndexChanged.emit(
+            self.select_environment.currentIndex()
+        )
+
+    def _get_environments_cache_key(self):
+        """
+        Get the cache key of the environments available in the environments
+        root path.
+
+        Returns
+        -------
+        str
+            The cache key.
+        """
+        return f"envs:{self._root_path}"
+
+    def _get_environments_cache_stamp(self):
+        """
+        Get the stamp the cached environments need to be valid.
+
+        It's the root path modification time, which changes when an environment
+        is created or removed on it.
+
+        Returns
+        -------
+        int or None
+            The cache stamp or None if the root path is not available.
+        """
+        try:
+            return os.stat(self._root_path).st_mtime_ns
+        except OSError:
+            return None
+
+    def _get_packages_cache_key(self, env_directory):
+        """
+        Get the cache key of the packages installed in an environment.
+
+        Parameters
+        ----------
+        env_directory : str
+            Path to the environment directory.
+
+        Returns
+        -------
+        str
+            The cache key.
+        """
+        return f"pkgs:{env_directory}"
+
+    def _get_packages_cache_stamp(self, env_directory):
+        """
+        Get the stamp the cached packages of an environment need to be valid.
+
+        It's the modification time of the environment `conda-meta` directory,
+        which changes when its packages change.
+
+        Parameters
+        ----------
+        env_directory : str
+            Path to the environment directory.
+
+        Returns
+        -------
+        int or None
+            The cache stamp or None if the environment metadata is not
+            available.
+        """
+        try:
+            return os.stat(osp.join(env_directory, "conda-meta")).st_mtime_ns
+        except (OSError, TypeError):
+            return None
+
+    def _get_cached_packages(self, env_directory):
+        """
+        Get the cached packages of an environment, if available.
+
+        The returned packages have the structure expected by
+        `EnvironmentPackagesTable.load_packages`.
+        """
+        cache_stamp = self._get_packages_cache_stamp(env_directory)
+        packages = (
+            cache_get(self._get_packages_cache_key(env_directory), stamp=cache_stamp)
+            if cache_stamp is not None
+            else None
+        )
+        if packages is not None:
+            # The requested packages bitmask is stored as an hex string
+            packages["requested"] = int(packages["requested"], 16)
+        return packages
+
+    def _cache_packages(self, env_directory, packages):
+        """Store the packages of an environment in the cache."""
+        cache_stamp = self._get_packages_cache_stamp(env_directory)
+        if cache_stamp is not None:
+            # Bitmasks can be bigger than the max int supported by msgpack
+            cache_put(
+                self._get_packages_cache_key(env_directory),
+                dict(packages, requested=format(packages["requested"], "x")),
+                stamp=cache_stamp,
             )
-        return page
 
     def _handle_package_table_context_menu_actions(self, action, package_info):
         """
@@ -454,9 +1060,7 @@ class SpyderEnvManagerWidget(PluginMainWidget):
         package_name = package_info["name"]
         if action == EnvironmentPackagesActions.UpdatePackage:
             title = _("Update package")
-            messages = _(
-                "Are you sure you want to update <tt>{package_name}</tt>?"
-            ).format(package_name=package_name)
+            messages = UPDATE_PACKAGE_MESSAGE.format(package_name=package_name)
             self._message_box(
                 title,
                 messages,
@@ -465,9 +1069,7 @@ class SpyderEnvManagerWidget(PluginMainWidget):
             )
         elif action == EnvironmentPackagesActions.UninstallPackage:
             title = _("Uninstall package")
-            messages = _(
-                "Are you sure you want to uninstall <tt>{package_name}</tt>?"
-            ).format(package_name=package_name)
+            messages = UNINSTALL_PACKAGE_MESSAGE.format(package_name=package_name)
             self._message_box(
                 title,
                 messages,
@@ -476,22 +1078,12 @@ class SpyderEnvManagerWidget(PluginMainWidget):
             )
         elif action == EnvironmentPackagesActions.InstallPackageVersion:
             title = _("Change package version constraint")
-            messages = ["Package", "Constraint", "Version"]
-            types = [
-                CustomParametersDialogWidgets.Label,
-                CustomParametersDialogWidgets.ComboBox,
-                CustomParametersDialogWidgets.LineEditVersion,
-            ]
-            contents = [
-                [package_info["name"]],
-                ["==", "<=", ">=", "<", ">", "latest"],
-                {},
-            ]
+            contents = [(package_name,), PACKAGE_CONSTRAINTS, ()]
             self._message_box_editable(
                 title,
-                messages,
+                PACKAGE_VERSION_MESSAGES,
                 contents,
-                types,
+                PACKAGE_VERSION_TYPES,
                 action=EnvironmentPackagesActions.InstallPackageVersion,
                 package_info=package_info,
             )
@@ -511,26 +1103,22 @@ class SpyderEnvManagerWidget(PluginMainWidget):
         None.
 
         """
-        if not self.get_conf(
-            SpyderEnvManagerWidgetActions.ToggleEnvironmentAsCustomInterpreter
-        ):
+        if not self._environment_as_custom_interpreter_enabled:
             return
         if not environment_path:
             environment_path = self.select_environment.currentData()
         if not environment_path:
             return
-        external_executable = self.get_conf("conda_file_executable_path")
-        backend = "conda-like"
         manager = Manager(
-            backend,
+            self._backend,
             env_directory=environment_path,
-            external_executable=external_executable,
+            external_executable=self._external_executable,
         )
         self.sig_set_spyder_custom_interpreter.emit(
             manager.env_name, manager.backend_instance.python_executable_path
         )
 
-    def _add_new_environment_entry(self, manager, action_result, result_message):
+    def _add_new_environment_entry(self, manager, result_message):
         """
         Handle the addition of a new Python environment to the GUI.
 
@@ -541,40 +1129,42 @@ class SpyderEnvManagerWidget(PluginMainWidget):
         ----------
         manager : envs_manager.manager.Manager
             Python environment manager instance that is handling the environment.
-        action_result : bool
-            True if the environment creation was successful. False otherwise.
-        result_message : str
-            Resulting error or failure message in case `action_result` is False.
+        result_message : object
+            Result of the action.
 
         Returns
         -------
         None.
 
         """
-        if action_result:
-            if not self.envs_available:
-                self.select_environment.clear()
-            self.select_environment.addItem(manager.env_name, manager.env_directory)
-            self.select_environment.setCurrentText(manager.env_name)
-            self.set_conf("selected_environment", manager.env_name)
-            self.envs_available = True
-        else:
-            self._message_error_box(result_message)
+        # Notify the environment change only once all the changes are done
+        signal_blocker = QSignalBlocker(self.select_environment)
+        self.select_environment.setUpdatesEnabled(False)
+        if not self.envs_available:
+            self.select_environment.clear()
+        self.select_environment.model().appendRow(
+            self._create_environment_item(manager.env_name, str(manager.env_directory))
+        )
+        self.select_environment.setCurrentText(manager.env_name)
+        self.select_environment.setUpdatesEnabled(True)
+        signal_blocker.unblock()
+        self.set_conf("selected_environment", manager.env_name)
+        self.envs[manager.env_name] = str(manager.env_directory)
+        self._cache_environments()
+        self._notify_environment_changed()
         self.stop_spinner()
 
-    def _after_import_environment(self, manager, action_result, result_message):
+    def _after_import_environment(self, manager, result_message):
         """
-        Handle the result of trying to create a new Python environment via the import
+        Handle the creation of a new Python environment via the import
         functionality.
 
         Parameters
         ----------
         manager : envs_manager.manager.Manager
             Python environment manager instance that is handling the env creation.
-        action_result : bool
-            True if the environment creation was successful. False otherwise.
-        result_message : str
-            Resulting error or failure message in case `action_result` is False.
+        result_message : object
+            Result of the action.
 
         Returns
         -------
@@ -582,81 +1172,67 @@ class SpyderEnvManagerWidget(PluginMainWidget):
 
         """
         # Add new imported environment entry
-        self._add_new_environment_entry(manager, action_result, result_message)
+        self._add_new_environment_entry(manager, result_message)
 
         # Install needed spyder-kernels version
-        if action_result:
-            packages = [f"spyder-kernels{SPYDER_KERNELS_VERSION}"]
-            self._run_env_manager_action(
-                manager,
-                manager.install,
-                self._after_package_changed,
-                packages,
-                force=True,
-                capture_output=True,
-            )
+        packages = [f"spyder-kernels{SPYDER_KERNELS_VERSION}"]
+        self._run_env_manager_action(
+            SpyderEnvManagerWidgetActions.InstallPackage,
+            manager,
+            manager.install,
+            packages,
+            force=True,
+            capture_output=True,
+        )
 
-    def _after_export_environment(self, manager, action_result, result_message):
+    def _after_export_environment(self, manager, result_message):
         """
-        Handle the result of trying to export a Python environment.
+        Handle the export of a Python environment.
 
-        This shows a message box mentioning that the operation was successful or
-        failed.
+        This shows a message box mentioning that the operation was successful.
 
         Parameters
         ----------
         manager : envs_manager.manager.Manager
             Python environment manager instance that is handling the operation.
-        action_result : bool
-            True if the environment exportation was successful. False otherwise.
-        result_message : str
-            Resulting error or failure message in case `action_result` is False.
+        result_message : object
+            Result of the action.
 
         Returns
         -------
         None.
 
         """
-        if action_result:
-            QMessageBox.information(
-                self,
-                _("Environment exported"),
-                _("Python Environment <tt>{env_name}</tt> was exported.").format(
-                    env_name=manager.env_name
-                ),
-            )
-        else:
-            self._message_error_box(result_message)
+        QMessageBox.information(
+            self,
+            _("Environment exported"),
+            _("Python Environment <tt>{env_name}</tt> was exported.").format(
+                env_name=manager.env_name
+            ),
+        )
         self.stop_spinner()
 
-    def _after_package_changed(self, manager, action_result, result_message):
+    def _after_package_changed(self, manager, result_message):
         """
-        Handle the result of trying to install, uninstall or update a package.
+        Handle the installation, uninstallation or update of a package.
 
-        This updates the list of packages in the current environment if the operation
-        was successful.
+        This updates the list of packages in the current environment.
 
         Parameters
         ----------
         manager : envs_manager.manager.Manager
             Python environment manager instance that is handling the environment.
-        action_result : bool
-            True if the package installation was successful. False otherwise.
-        result_message : str
-            Resulting error or failure message in case `action_result` is False.
+        result_message : object
+            Result of the action.
 
         Returns
         -------
         None.
 
         """
-        if action_result:
-            self.current_environment_changed()
-        else:
-            self._message_error_box(result_message)
-            self.stop_spinner()
+        self.current_environment_changed()
 
-    def _after_delete_environment(self, manager, action_result, result_message):
+    def _after_delete_environment(self, manager, result_message):
         """
         Handle the result of deleting a Python environment.
 
@@ -666,27 +1242,56 @@ class SpyderEnvManagerWidget(PluginMainWidget):
         ----------
         manager : envs_manager.manager.Manager
             Python environment manager instance that deleted the environment.
-        action_result : bool
-            True if the environment deletion was successful. False otherwise.
-        result_message : str
-            Resulting error or failure message in case `action_result` is False.
+        result_message : object
+            Result of the action.
 
         Returns
         -------
         None.
 
         """
-        if action_result:
-            env_name = self.select_environment.currentIndex()
-            self.select_environment.removeItem(env_name)
-            if self.select_environment.count() == 0:
-                self.envs_available = False
-                self.select_environment.addItem(self.NO_ENVIRONMENTS_AVAILABLE, None)
-        else:
-            self._message_error_box(result_message)
+        env_directory = self.select_environment.currentData()
+        self._managers_by_dir.pop(env_directory, None)
+        cache_delete(self._get_packages_cache_key(env_directory))
+        self.envs.pop(self.select_environment.currentText(), None)
+        self._cache_environments()
+        signal_blocker = QSignalBlocker(self.select_environment)
+        self.select_environment.removeItem(self.select_environment.currentIndex())
+        if not self.envs_available:
+            self.select_environment.model().appendRow(
+                self._create_environment_item(self.NO_ENVIRONMENTS_AVAILABLE)
+            )
+        signal_blocker.unblock()
+        self._notify_environment_changed()
         self.stop_spinner()
 
-    def _after_list_environment_packages(self, manager, action_result, result_message):
+    def _after_list_environments(self, manager, result_message):
+        """
+        Handle the result of listing the available environments.
+
+        This fills the `select_environment` combobox with them.
+
+        Parameters
+        ----------
+        manager : None
+            No manager is needed to list the environments.
+        result_message : dict
+            Environments directories by name.
+
+        Returns
+        -------
+        None.
+
+        """
+        current_env_name = self._get_environment_to_select()
+        self.envs = result_message
+        self._envs_listed_at = time.time()
+        self._managers_by_dir.clear()
+        self._cache_environments()
+        self._populate_environments(current_env_name)
+        self._notify_environment_changed()
+
+    def _after_list_environment_packages(self, manager, result_message):
         """
         Handle the result of computing the current selected environment packages list.
 
@@ -696,44 +1301,100 @@ class SpyderEnvManagerWidget(PluginMainWidget):
         ----------
         manager : envs_manager.manager.Manager
             Python environment manager instance that is handling the environment.
+        result_message : object
+            Result of the action.
+
+        Returns
+        -------
+        None.
+
+        """
+        packages = result_message["packages"]
+        self._cache_packages(str(manager.env_directory), packages)
+        self.update_packages(self.exclude_non_requested_packages, packages)
+
+    def _on_manager_action_ready(
+        self, job_id, action_id, manager, action_result, result_message
+    ):
+        """
+        Handle the result of an environment manager action.
+
+        On success, the handler registered for the action is called. Otherwise
+        an error message is shown.
+
+        Parameters
+        ----------
+        job_id : int
+            Id of the job that ran the action.
+        action_id : str
+            Id of the action that finished.
+        manager : envs_manager.manager.Manager
+            Python environment manager instance that ran the action.
         action_result : bool
-            True if the package listing was successful. False otherwise.
-        result_message : str
-            Resulting error or failure message in case `action_result` is False.
+            True if the action was successful. False otherwise.
+        result_message : object
+            Result of the action or error message in case `action_result` is
+            False.
 
         Returns
         -------
         None.
 
         """
+        if action_id == SpyderEnvManagerWidgetActions.ListEnvironments:
+            self._envs_loading = False
+            if not action_result:
+                # Show the known environments, or that there are none, instead
+                # of the loading message and keep the views in sync with it
+                self._populate_environments(self._get_environment_to_select())
+                if self.envs_available:
+                    self._notify_environment_changed()
+                else:
+                    self.current_environment_changed()
+
+        # Packages listed for an environment that's not the current one anymore
+        if (
+            action_id == SpyderEnvManagerWidgetActions.ListPackages
+            and job_id != self._last_job_id
+        ):
+            return
+
         if action_result:
-            self.update_packages(
-                self.exclude_non_requested_packages, result_message["packages"]
+            self._after_action_handlers[action_id](manager, result_message)
+        elif action_id in self._status_bar_error_action_ids:
+            # Nothing changed, so the user just needs to know about the failure
+            self.sig_status_message.emit(
+                ENVIRONMENT_CREATION_ERROR_MESSAGE.format(
+                    error=to_plain_text(result_message)
+                ),
+                STATUS_MESSAGE_TIMEOUT,
             )
+            self.stop_spinner()
         else:
             self._message_error_box(result_message)
-        self.stop_spinner()
+            self.stop_spinner()
 
     def _run_env_manager_action(
         self,
+        action_id,
         manager,
         manager_action,
-        on_ready,
         *manager_action_args,
         **manager_action_kwargs,
     ):
         """
-        Run Python environment manager in a worker and connect the result to a given
-        callback.
+        Queue a Python environment manager action to be run in the actions
+        thread and handle its result once it finishes.
 
         Parameters
         ----------
+        action_id : str
+            Id of the action to run. It's used to get the handler of the
+            action result (see `_on_manager_action_ready`).
         manager : envs_manager.manager.Manager
             Python environment manager instance to use.
         manager_action : envs_manager.manager.Manager callable
             Method to run from the Python environment manager instance.
-        on_ready : SpyderEnvManagerWidget callable
-            Method to run when the action finishes.
         *manager_action_args : list
             args for the manager callable to be run by the worker.
         **manager_action_kwargs : dict
@@ -744,26 +1405,24 @@ class SpyderEnvManagerWidget(PluginMainWidget):
         None.
 
         """
-        if (
-            self.env_manager_action_thread
-            and self.env_manager_action_thread.isRunning()
-        ):
-            self.env_manager_action_thread.terminate()
-            self.env_manager_action_thread.wait()
+        # A pending environment change handling would interrupt this action
+        self._env_change_timer.stop()
 
-        self.manager_worker = EnvironmentManagerWorker(
-            self,
+        # The thread is stopped when the widget is closed, but the widget can
+        # be shown again afterwards
+        if not self.env_manager_action_thread.isRunning():
+            self.env_manager_action_thread.start()
+
+        self._last_job_id += 1
+        self.start_spinner()
+        self._job_runner.sig_run.emit(
+            self._last_job_id,
+            action_id,
             manager,
             manager_action,
-            *manager_action_args,
-            **manager_action_kwargs,
+            manager_action_args,
+            manager_action_kwargs,
         )
-        self.manager_worker.moveToThread(self.env_manager_action_thread)
-        self.manager_worker.sig_ready.connect(on_ready)
-        self.manager_worker.sig_ready.connect(self.env_manager_action_thread.quit)
-        self.env_manager_action_thread.started.connect(self.manager_worker.start)
-        self.start_spinner()
-        self.env_manager_action_thread.start()
 
     def _run_action_for_package(self, package_info, dialog=None, action=None):
         """
@@ -788,22 +1447,20 @@ class SpyderEnvManagerWidget(PluginMainWidget):
         None.
 
         """
-        root_path = Path(self.get_conf("environments_path"))
-        external_executable = self.get_conf("conda_file_executable_path")
-        backend = "conda-like"
+        backend = self._backend
         package_name = package_info["name"]
         if action == EnvironmentPackagesActions.UpdatePackage:
             env_name = self.select_environment.currentText()
             manager = Manager(
                 backend,
-                root_path=root_path,
+                root_path=self._root_path,
                 env_name=env_name,
-                external_executable=external_executable,
+                external_executable=self._external_executable,
             )
             self._run_env_manager_action(
+                EnvironmentPackagesActions.UpdatePackage,
                 manager,
                 manager.update,
-                self._after_package_changed,
                 [package_name],
                 force=True,
                 capture_output=True,
@@ -812,14 +1469,14 @@ class SpyderEnvManagerWidget(PluginMainWidget):
             env_name = self.select_environment.currentText()
             manager = Manager(
                 backend,
-                root_path=root_path,
+                root_path=self._root_path,
                 env_name=env_name,
-                external_executable=external_executable,
+                external_executable=self._external_executable,
             )
             self._run_env_manager_action(
+                EnvironmentPackagesActions.UninstallPackage,
                 manager,
                 manager.uninstall,
-                self._after_package_changed,
                 [package_name],
                 force=True,
                 capture_output=True,
@@ -833,14 +1490,14 @@ class SpyderEnvManagerWidget(PluginMainWidget):
             env_name = self.select_environment.currentText()
             manager = Manager(
                 backend,
-                root_path=root_path,
+                root_path=self._root_path,
                 env_name=env_name,
-                external_executable=external_executable,
+                external_executable=self._external_executable,
             )
             self._run_env_manager_action(
+                EnvironmentPackagesActions.InstallPackageVersion,
                 manager,
                 manager.install,
-                self._after_package_changed,
                 packages,
                 force=True,
                 capture_output=True,
@@ -869,9 +1526,12 @@ class SpyderEnvManagerWidget(PluginMainWidget):
         None.
 
         """
-        root_path = Path(self.get_conf("environments_path"))
-        external_executable = self.get_conf("conda_file_executable_path")
-        backend = "conda-like"
+        # The action could have been triggered right before the environments
+        # changed
+        if action in self._env_dependent_action_ids and not self.envs_available:
+            return
+
+        backend = self._backend
         if dialog and action == SpyderEnvManagerWidgetActions.NewEnvironment:
             backend = dialog.combobox.currentText()
             env_name = dialog.lineedit_string.text()
@@ -882,14 +1542,14 @@ class SpyderEnvManagerWidget(PluginMainWidget):
             ]
             manager = Manager(
                 backend,
-                root_path=root_path,
+                root_path=self._root_path,
                 env_name=env_name,
-                external_executable=external_executable,
+                external_executable=self._external_executable,
             )
             self._run_env_manager_action(
+                SpyderEnvManagerWidgetActions.NewEnvironment,
                 manager,
                 manager.create_environment,
-                self._add_new_environment_entry,
                 packages=packages,
                 force=True,
             )
@@ -899,14 +1559,14 @@ class SpyderEnvManagerWidget(PluginMainWidget):
             import_file_path = dialog.file_combobox.combobox.currentText()
             manager = Manager(
                 backend,
-                root_path=root_path,
+                root_path=self._root_path,
                 env_name=env_name,
-                external_executable=external_executable,
+                external_executable=self._external_executable,
             )
             self._run_env_manager_action(
+                SpyderEnvManagerWidgetActions.ImportEnvironment,
                 manager,
                 manager.import_environment,
-                self._after_import_environment,
                 import_file_path,
                 force=True,
             )
@@ -920,14 +1580,14 @@ class SpyderEnvManagerWidget(PluginMainWidget):
             env_name = self.select_environment.currentText()
             manager = Manager(
                 backend,
-                root_path=root_path,
+                root_path=self._root_path,
                 env_name=env_name,
-                external_executable=external_executable,
+                external_executable=self._external_executable,
             )
             self._run_env_manager_action(
+                SpyderEnvManagerWidgetActions.InstallPackage,
                 manager,
                 manager.install,
-                self._after_package_changed,
                 packages,
                 force=True,
                 capture_output=True,
@@ -936,28 +1596,31 @@ class SpyderEnvManagerWidget(PluginMainWidget):
             env_name = self.select_environment.currentText()
             manager = Manager(
                 backend,
-                root_path=root_path,
+                root_path=self._root_path,
                 env_name=env_name,
-                external_executable=external_executable,
+                external_executable=self._external_executable,
             )
             self._run_env_manager_action(
+                SpyderEnvManagerWidgetActions.DeleteEnvironment,
                 manager,
                 manager.delete_environment,
-                self._after_delete_environment,
                 force=True,
             )
         elif action == SpyderEnvManagerWidgetActions.ListPackages:
             env_directory = self.select_environment.currentData()
             if env_directory:
-                manager = Manager(
-                    backend,
-                    env_directory=env_directory,
-                    external_executable=external_executable,
-                )
+                manager = self._managers_by_dir.get(env_directory)
+                if manager is None:
+                    manager = self._managers_by_dir[env_directory] = Manager(
+                        backend,
+                        env_directory=env_directory,
+                        external_executable=self._external_executable,
+                    )
                 self._run_env_manager_action(
+                    SpyderEnvManagerWidgetActions.ListPackages,
+                    manager,
+                    list_packages,
                     manager,
-                    manager.list,
-                    self._after_list_environment_packages,
                 )
         elif dialog and action == SpyderEnvManagerWidgetActions.ExportEnvironment:
             backend = dialog.combobox.currentText()
@@ -965,27 +1628,30 @@ class SpyderEnvManagerWidget(PluginMainWidget):
             export_file_path = dialog.file_lineedit.lineedit.text()
             manager = Manager(
                 backend,
-                root_path=root_path,
+                root_path=self._root_path,
                 env_name=env_name,
-                external_executable=external_executable,
+                external_executable=self._external_executable,
             )
             self._run_env_manager_action(
+                SpyderEnvManagerWidgetActions.ExportEnvironment,
                 manager,
                 manager.export_environment,
-                self._after_export_environment,
                 export_file_path=export_file_path,
             )
         else:
             self._message_error_box("Action unavailable at this moment.")
 
     def _message_export_environment(self):
+        if not self.envs_available:
+            return
+
         title = _("Export Python environment")
         messages = [_("Manager to use"), _("Environment file")]
         types = [
             CustomParametersDialogWidgets.ComboBox,
             CustomParametersDialogWidgets.LineEditFile,
         ]
-        contents = [{"conda-like"}, {}]
+        contents = [ENVIRONMENT_MANAGERS, ()]
         self._message_box_editable(
             title,
             messages,
@@ -995,6 +1661,9 @@ class SpyderEnvManagerWidget(PluginMainWidget):
         )
 
     def _message_delete_environment(self):
+        if not self.envs_available:
+            return
+
         title = _("Delete environment")
         messages = _("Are you sure you want to delete the current environment?")
         self._message_box(
@@ -1015,7 +1684,7 @@ class SpyderEnvManagerWidget(PluginMainWidget):
             CustomParametersDialogWidgets.LineEditString,
             CustomParametersDialogWidgets.ComboBoxFile,
         ]
-        contents = [{"conda-like"}, {}, {}]
+        contents = [ENVIRONMENT_MANAGERS, (), ()]
         self._message_box_editable(
             title,
             messages,
@@ -1032,11 +1701,7 @@ class SpyderEnvManagerWidget(PluginMainWidget):
             CustomParametersDialogWidgets.LineEditString,
             CustomParametersDialogWidgets.ComboBoxEdit,
         ]
-        contents = [
-            {"conda-like"},
-            {},
-            ["3.8.16", "3.9.16", "3.10.9", "3.11.0"],
-        ]
+        contents = [ENVIRONMENT_MANAGERS, (), PYTHON_VERSIONS]
         self._message_box_editable(
             title,
             messages,
@@ -1046,6 +1711,9 @@ class SpyderEnvManagerWidget(PluginMainWidget):
         )
 
     def _message_install_package(self):
+        if not self.envs_available:
+            return
+
         title = _("Install package")
         messages = ["Package", "Constraint", "Version"]
         types = [
@@ -1053,7 +1721,7 @@ class SpyderEnvManagerWidget(PluginMainWidget):
             CustomParametersDialogWidgets.ComboBox,
             CustomParametersDialogWidgets.LineEditVersion,
         ]
-        contents = [{}, ["==", "<=", ">=", "<", ">", "latest"], {}]
+        contents = [(), PACKAGE_CONSTRAINTS, ()]
         self._message_box_editable(
             title,
             messages,
@@ -1095,23 +1763,23 @@ class SpyderEnvManagerWidget(PluginMainWidget):
         None.
 
         """
-        box = CustomParametersDialog(
-            self,
-            title=title,
-            messages=messages,
-            types=types,
-            contents=contents,
-        )
-        box.setMaximumWidth(box.width())
-        box.setMaximumHeight(box.height())
-        box.setMinimumWidth(box.width())
-        box.setMinimumHeight(box.height())
-        result = box.exec_()
-        if result == QDialog.Accepted:
-            if package_info:
-                self._run_action_for_package(package_info, dialog=box, action=action)
-            else:
-                self._run_action_for_env(dialog=box, action=action)
+        box = self._dialog_cache.get(action)
+        if box is None:
+            box = CustomParametersDialog(
+                self,
+                title=title,
+                messages=messages,
+                types=types,
+                contents=contents,
+            )
+            box.finished.connect(partial(self._on_editable_finished, box))
+            if action is not None:
+                self._dialog_cache[action] = box
+        else:
+            box.reset(contents)
+        box.action = action
+        box.package_info = package_info
+        self._open_dialog(box)
 
     def _message_box(self, title, message, action=None, package_info=None):
         """
@@ -1139,18 +1807,20 @@ class SpyderEnvManagerWidget(PluginMainWidget):
         None.
 
         """
-        box = QMessageBox(self)
+        box = self._dialog_cache.get(action)
+        if box is None:
+            box = QMessageBox(self)
+            box.setIcon(QMessageBox.Question)
+            box.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
+            box.finished.connect(partial(self._on_message_box_finished, box))
+            if action is not None:
+                self._dialog_cache[action] = box
         box.setWindowTitle(title)
-        box.setIcon(QMessageBox.Question)
-        box.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
         box.setDefaultButton(QMessageBox.Yes)
         box.setText(message)
-        result = box.exec_()
-        if result == QMessageBox.Yes:
-            if package_info:
-                self._run_action_for_package(package_info, action=action)
-            else:
-                self._run_action_for_env(dialog=box, action=action)
+        box.action = action
+        box.package_info = package_info
+        self._open_dialog(box)
 
     def _message_error_box(self, message):
         """
@@ -1166,10 +1836,106 @@ class SpyderEnvManagerWidget(PluginMainWidget):
         None.
 
         """
-        box = QMessageBox(self)
-        box.setWindowTitle("Error message")
-        box.setIcon(QMessageBox.Critical)
-        box.setStandardButtons(QMessageBox.Ok)
+        # Reuse the error box unless it's still showing a previous error
+        box = self._error_box
+        if box is None or box in self._active_dialogs:
+            box = QMessageBox(self)
+            box.setWindowTitle("Error message")
+            box.setIcon(QMessageBox.Critical)
+            box.setStandardButtons(QMessageBox.Ok)
+            box.finished.connect(partial(self._on_dialog_finished, box))
+            if self._error_box is None:
+                self._error_box = box
         box.setDefaultButton(QMessageBox.Ok)
         box.setText(message)
-        box.exec_()
+        self._open_dialog(box)
+
+    def _open_dialog(self, box):
+        """
+        Show a dialog without blocking the interface until it's closed.
+
+        The dialog is kept alive until it's finished (see
+        `_on_dialog_finished`) or for as long as the widget if it's cached to
+        be reused.
+
+        Parameters
+        ----------
+        box : QDialog
+            Dialog to show.
+
+        Returns
+        -------
+        None.
+
+        """
+        self._active_dialogs.add(box)
+        box.open()
+
+    def _on_dialog_finished(self, box, result=None):
+        """
+        Release a dialog shown with `_open_dialog` once it's closed.
+
+        Parameters
+        ----------
+        box : QDialog
+            Dialog that was closed.
+        result : int, optional
+            Dialog result. The default is None.
+
+        Returns
+        -------
+        None.
+
+        """
+        self._active_dialogs.discard(box)
+        if box is not self._error_box and box not in self._dialog_cache.values():
+            box.deleteLater()
+
+    def _on_editable_finished(self, box, result):
+        """
+        Run the action requested with a `CustomParametersDialog` if it was
+        accepted.
+
+        Parameters
+        ----------
+        box : CustomParametersDialog
+            Dialog that was closed.
+        result : int
+            Dialog result.
+
+        Returns
+        -------
+        None.
+
+        """
+        if result == QDialog.Accepted:
+            if box.package_info:
+                self._run_action_for_package(
+                    box.package_info, dialog=box, action=box.action
+                )
+            else:
+                self._run_action_for_env(dialog=box, action=box.action)
+        self._on_dialog_finished(box)
+
+    def _on_message_box_finished(self, box, result):
+        """
+        Run the action approved with a `QMessageBox` if the user accepted it.
+
+        Parameters
+        ----------
+        box : QMessageBox
+            Message box that was closed.
+        result : int
+            Button clicked by the user.
+
+        Returns
+        -------
+        None.
+
+        """
+        if result == QMessageBox.Yes:
+            if box.package_info:
+                self._run_action_for_package(box.package_info, action=box.action)
+            else:
+                self._run_action_for_env(dialog=box, action=box.action)
+        self._on_dialog_finished(box)
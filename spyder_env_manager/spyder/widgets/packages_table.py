@@ -15,8 +15,8 @@ This is the main widget used in the Spyder env Manager plugin
 # Third library imports
 from qtpy.compat import to_qvariant
 from qtpy.QtCore import QAbstractTableModel, QModelIndex, Qt, Signal
-from qtpy.QtGui import QColor
-from qtpy.QtWidgets import QAbstractItemView, QTableView
+from qtpy.QtGui import QColor, QFontMetrics
+from qtpy.QtWidgets import QAbstractItemView, QHeaderView, QTableView
 
 # Spyder and local imports
 from spyder.api.translations import get_translation
@@ -33,6 +33,12 @@ _ = get_translation("spyder")
 # Column constants
 NAME, VERSION, DESCRIPTION = [0, 1, 2]
 
+# Expected width, in characters, of the columns that aren't stretched
+COLUMN_WIDTHS_IN_CHARS = {NAME: 30, VERSION: 15}
+
+# Extra vertical space, in pixels, added to the rows height
+ROW_HEIGHT_PADDING = 4
+
 
 class EnvironmentPackagesActions:
     """
@@ -52,9 +58,11 @@ class EnvironmentPackagesMenu:
 class EnvironmentPackagesModel(QAbstractTableModel):
     def __init__(self, parent):
         super().__init__(parent)
-        self.all_packages = []
-        self.packages = []
-        self.packages_map = {}
+        self.names = []
+        self.versions = []
+        self.descriptions = []
+        self.requested = 0
+        self.rows = []
 
     def flags(self, index):
         """Qt Override."""
@@ -65,28 +73,28 @@ class EnvironmentPackagesModel(QAbstractTableModel):
     def data(self, index, role=Qt.DisplayRole):
         """Qt Override."""
         row = index.row()
-        if not index.isValid() or not (0 <= row < len(self.packages)):
+        if not index.isValid() or not (0 <= row < len(self.rows)):
             return to_qvariant()
 
-        package = self.packages[row]
+        package_index = self.rows[row]
         column = index.column()
 
         if role == Qt.DisplayRole:
             if column == NAME:
-                text = package["name"]
+                text = self.names[package_index]
                 return to_qvariant(text)
             elif column == DESCRIPTION:
-                text = package["description"]
+                text = self.descriptions[package_index]
                 return to_qvariant(text)
             elif column == VERSION:
-                text = package["version"]
+                text = self.versions[package_index]
                 return to_qvariant(text)
         elif role == Qt.TextAlignmentRole:
             return to_qvariant(int(Qt.AlignCenter))
         elif role == Qt.FontRole:
             return to_qvariant(get_font(font_size_delta=DEFAULT_SMALL_DELTA))
         elif role == Qt.BackgroundColorRole:
-            if package["requested"]:
+            if self.is_requested(package_index):
                 return to_qvariant(QColor(SpyderPalette.COLOR_OCCURRENCE_4))
         return to_qvariant()
 
@@ -109,12 +117,27 @@ class EnvironmentPackagesModel(QAbstractTableModel):
 
     def rowCount(self, index=QModelIndex()):
         """Qt Override."""
-        return len(self.packages)
+        return len(self.rows)
 
     def columnCount(self, index=QModelIndex()):
         """Qt Override."""
         return 3
 
+    def is_requested(self, package_index):
+        """Check if the package at the given position was requested."""
+        return bool(self.requested >> package_index & 1)
+
+    def get_package_info(self, row):
+        """Get the information of the package shown at the given row."""
+        package_index = self.rows[row]
+        return {
+            "name": self.names[package_index],
+            "version": self.versions[package_index],
+            "description": self.descriptions[package_index],
+            "requested": self.is_requested(package_index),
+            "index": row,
+        }
+
 
 class EnvironmentPackagesTable(QTableView, SpyderWidgetMixin):
     """Table widget to show the installed packages in an environment."""
@@ -147,6 +170,21 @@ class EnvironmentPackagesTable(QTableView, SpyderWidgetMixin):
         self.setEditTriggers(QAbstractItemView.AllEditTriggers)
         self.verticalHeader().hide()
         self.horizontalHeader().setStretchLastSection(True)
+
+        # Use a fixed rows height and precomputed columns widths, so loading
+        # packages doesn't need to measure the contents of every row
+        font_metrics = QFontMetrics(get_font(font_size_delta=DEFAULT_SMALL_DELTA))
+        vertical_header = self.verticalHeader()
+        vertical_header.setSectionResizeMode(QHeaderView.Fixed)
+        vertical_header.setDefaultSectionSize(
+            font_metrics.height() + ROW_HEIGHT_PADDING
+        )
+        horizontal_header = self.horizontalHeader()
+        for column, width_in_chars in COLUMN_WIDTHS_IN_CHARS.items():
+            horizontal_header.setSectionResizeMode(column, QHeaderView.Interactive)
+            self.setColumnWidth(
+                column, font_metrics.horizontalAdvance("M" * width_in_chars)
+            )
         self.load_packages(False)
 
     def get_package_info(self, index):
@@ -164,7 +202,7 @@ class EnvironmentPackagesTable(QTableView, SpyderWidgetMixin):
             Package information available.
 
         """
-        return self.source_model.packages[index]
+        return self.source_model.get_package_info(index)
 
     def load_packages(self, only_requested=False, packages=None):
         """
@@ -175,44 +213,45 @@ class EnvironmentPackagesTable(QTableView, SpyderWidgetMixin):
         only_requested : bool, optional
             True if the packages should be filtered and only requested packages
             be kept. The default is False.
-        packages : list[dict], optional
-            List of packages to be displayed on the widget. The default is None.
-            The expected package structure is as follows:
+        packages : dict, optional
+            Packages to be displayed on the widget stored by columns.
+            The default is None. The expected structure is as follows:
 
 
             ```
-            packages = [
-                {
-                    "name": "package name",
-                    "description": "package description",
-                    "version": "0.0.1",
-                    "requested": False,
-                },
-            ]
+            packages = {
+                "names": ["package name"],
+                "versions": ["0.0.1"],
+                "descriptions": ["package description"],
+                "requested": 0,
+            }
             ```
 
+            where `requested` is a bitmask with the bit `i` set if the
+            package `i` was requested.
+
         Returns
         -------
         None.
 
         """
-
-        if packages:
-            self.source_model.all_packages = packages
-        if not packages and self.source_model.all_packages:
-            packages = self.source_model.all_packages
-        if packages:
-            if only_requested:
-                packages = list(filter(lambda package: package["requested"], packages))
-            for idx, package in enumerate(packages):
-                package["index"] = idx
-            packages_map = {package["name"]: package for package in packages}
-            self.source_model.beginResetModel()
-            self.source_model.packages = packages
-            self.source_model.packages_map = packages_map
-            self.source_model.endResetModel()
-
-            self.resizeColumnToContents(NAME)
+        model = self.source_model
+
+        # Reset the model only once, so the view relayouts a single time no
+        # matter how many packages are loaded
+        model.beginResetModel()
+        if packages is not None:
+            model.names = packages["names"]
+            model.versions = packages["versions"]
+            model.descriptions = packages["descriptions"]
+            model.requested = packages["requested"]
+        if only_requested:
+            model.rows = [
+                idx for idx in range(len(model.names)) if model.is_requested(idx)
+            ]
+        else:
+            model.rows = list(range(len(model.names)))
+        model.endResetModel()
 
     def next_row(self):
         """Move to next row from currently selected row."""
@@ -234,13 +273,15 @@ class EnvironmentPackagesTable(QTableView, SpyderWidgetMixin):
         """Qt Override."""
         self.context_menu.clear_actions()
         row = self.rowAt(event.pos().y())
-        packages = self.source_model.packages
-        if packages and packages[row]["requested"]:
+        package_info = None
+        if 0 <= row < self.source_model.rowCount():
+            package_info = self.get_package_info(row)
+        if package_info and package_info["requested"]:
             update_action = self.create_action(
                 self,
                 _("Update package"),
                 triggered=lambda triggered: self.sig_action_context_menu.emit(
-                    EnvironmentPackagesActions.UpdatePackage, packages[row]
+                    EnvironmentPackagesActions.UpdatePackage, package_info
                 ),
                 overwrite=True,
             )
@@ -248,7 +289,7 @@ class EnvironmentPackagesTable(QTableView, SpyderWidgetMixin):
                 self,
                 _("Uninstall package"),
                 triggered=lambda triggered: self.sig_action_context_menu.emit(
-                    EnvironmentPackagesActions.UninstallPackage, packages[row]
+                    EnvironmentPackagesActions.UninstallPackage, package_info
                 ),
                 overwrite=True,
             )
@@ -256,7 +297,7 @@ class EnvironmentPackagesTable(QTableView, SpyderWidgetMixin):
                 self,
                 _("Change package version with a constraint"),
                 triggered=lambda triggered: self.sig_action_context_menu.emit(
-                    EnvironmentPackagesActions.InstallPackageVersion, packages[row]
+                    EnvironmentPackagesActions.InstallPackageVersion, package_info
                 ),
                 overwrite=True,
             )
@@ -11,7 +11,8 @@ import logging
 import subprocess
 
 # Third-party imports
-from qtpy.QtCore import QObject, Signal
+from envs_manager.manager import Manager
+from qtpy.QtCore import QObject, Signal, Slot
 
 # Spyder and local imports
 from spyder.api.translations import get_translation
@@ -23,18 +24,113 @@ _ = get_translation("spyder")
 logger = logging.getLogger(__name__)
 
 
-class EnvironmentManagerWorker(QObject):
+def packages_to_columns(packages):
     """
-    Worker to run environment manager actions over environments
-    without blocking the Spyder user interface.
+    Convert a list of packages information to a column oriented structure.
+
+    Parameters
+    ----------
+    packages : list[dict]
+        Packages information as given by `envs_manager.manager.Manager.list`.
+        Each package should have the `name`, `version`, `description` and
+        `requested` keys.
+
+    Returns
+    -------
+    dict
+        Packages information by columns (`names`, `versions` and
+        `descriptions` lists). The `requested` value is an int bitmask where
+        the bit `i` is set if the package `i` was requested.
+    """
+    requested = 0
+    for idx, package in enumerate(packages):
+        if package["requested"]:
+            requested |= 1 << idx
+    return {
+        "names": [package["name"] for package in packages],
+        "versions": [package["version"] for package in packages],
+        "descriptions": [package["description"] for package in packages],
+        "requested": requested,
+    }
+
+
+def list_environments(backend, root_path, external_executable):
+    """
+    List the environments available in the given root path.
+
+    Parameters
+    ----------
+    backend : str
+        Id of the backend used to look for environments.
+    root_path : str
+        Path where the environments are located.
+    external_executable : str
+        Path to the executable used by the backend.
+
+    Returns
+    -------
+    tuple
+        True and the environments directories by name.
+    """
+    envs, __ = Manager.list_environments(
+        backend=backend,
+        root_path=root_path,
+        external_executable=external_executable,
+    )
+    return True, {env_name: str(env_dir) for env_name, env_dir in envs.items()}
+
+
+def list_packages(manager):
+    """
+    List the packages of the environment handled by the given manager.
+
+    The packages information is returned by columns (see `packages_to_columns`).
+    """
+    result, message = manager.list()
+    if result:
+        message = dict(message, packages=packages_to_columns(message["packages"]))
+    return result, message
+
+
+class EnvironmentJobRunner(QObject):
     """
+    Runner of environment manager actions over environments without blocking
+    the Spyder user interface.
 
-    sig_ready = Signal(object, bool, object)
+    The runner is expected to live in its own thread. Actions are queued with
+    `sig_run` and run one after the other in that thread.
     """
-    Signal to inform that the worker has finished successfully.
+
+    sig_run = Signal(int, str, object, object, object, object)
+    """
+    Signal to queue an environment manager action to be run.
 
     Parameters
     ----------
+    job_id: int
+        Id of the job.
+    action_id: str
+        Id of the action to run.
+    manager: object
+        Manager object instance handling the environment
+    manager_action: callable
+        Manager method to run.
+    manager_args: tuple
+        args to pass to `manager_action`.
+    manager_kwargs: dict
+        kwargs to pass to `manager_action`.
+    """
+
+    sig_ready = Signal(int, str, object, bool, object)
+    """
+    Signal to inform that an action has finished.
+
+    Parameters
+    ----------
+    job_id: int
+        Id of the job.
+    action_id: str
+        Id of the action that was run.
     manager: object
         Manager object instance handling the environment
     result: bool
@@ -43,35 +139,22 @@ class EnvironmentManagerWorker(QObject):
         Subprocess result or string message containing handled errors to be shown.
     """
 
-    def __init__(
-        self, parent, manager, manager_action, *manager_args, **manager_kwargs
-    ):
+    def __init__(self):
         QObject.__init__(self)
-        self._parent = parent
-        self.manager = manager
-        self.manager_action = manager_action
-        self.manager_args = manager_args
-        self.manager_kwargs = manager_kwargs
-        self.error = None
-
-    def run_manager_action(self):
-        """Execute environment manager action and return."""
-        logger.info(f"Running manager action: {self.manager_action}")
+        self.sig_run.connect(self.run)
 
-        manager_action_result = self.manager_action(
-            *self.manager_args, **self.manager_kwargs
-        )
-
-        logger.debug(f"Manager action result: {manager_action_result}")
-
-        return manager_action_result
+    @Slot(int, str, object, object, object, object)
+    def run(
+        self, job_id, action_id, manager, manager_action, manager_args, manager_kwargs
+    ):
+        """Run an environment manager action and emit its result."""
+        logger.info(f"Running manager action: {manager_action}")
 
-    def start(self):
-        """Main method of the worker."""
         result = False
         message = error_msg = None
         try:
-            result, message = self.run_manager_action()
+            result, message = manager_action(*manager_args, **manager_kwargs)
+            logger.debug(f"Manager action result: {(result, message)}")
             if isinstance(message, subprocess.CompletedProcess):
                 message = message.stdout
         except Exception as e:
@@ -81,8 +164,9 @@ class EnvironmentManagerWorker(QObject):
             ).format(exception_string=str(e))
             logger.exception(error_msg)
 
-        self.error = error_msg
         try:
-            self.sig_ready.emit(self.manager, result, message or error_msg)
+            self.sig_ready.emit(
+                job_id, action_id, manager, result, message or error_msg
+            )
         except RuntimeError:
             pass
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Copyright © 2022, Spyder Development Team and spyder-env-manager contributors
+#
+# Licensed under the terms of the MIT license
+# ----------------------------------------------------------------------------
+"""
+Spyder Env Manager cache tests.
+"""
+# Local imports
+from spyder_env_manager.spyder import cache
+
+
+def test_cache_put_and_get(tmp_path, monkeypatch):
+    """Test storing and retrieving values from the cache."""
+    monkeypatch.setattr(cache, "get_cache_dir", lambda: str(tmp_path))
+    value = {"names": ["python", "pip"], "requested": "1"}
+
+    assert cache.cache_get("pkgs:env", stamp=1) is None
+    cache.cache_put("pkgs:env", value, stamp=1)
+    assert cache.cache_get("pkgs:env", stamp=1) == value
+    assert cache.cache_get("pkgs:env", stamp=2) is None
+
+    # New values replace the previous ones instead of adding entries
+    cache.cache_put("pkgs:env", value, stamp=2)
+    assert cache.cache_get("pkgs:env", stamp=2) == value
+    assert len(list(tmp_path.iterdir())) == 1
+
+    cache.cache_delete("pkgs:env")
+    assert cache.cache_get("pkgs:env", stamp=2) is None
+    assert not list(tmp_path.iterdir())
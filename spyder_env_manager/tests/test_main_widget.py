@@ -8,6 +8,7 @@
 Spyder Env Manager main widget tests.
 """
 # Local imports
+from spyder_env_manager.spyder import cache
 from spyder_env_manager.spyder.widgets.main_widget import SpyderEnvManagerWidget
 from spyder_env_manager.spyder.config import CONF_DEFAULTS, CONF_SECTION
 
@@ -25,11 +26,18 @@ def test_main_widget(qtbot, tmp_path, monkeypatch):
                 _, config_default_values = CONF_DEFAULTS[0]
                 return config_default_values[option]
             except KeyError:
-                return None
+                return default
 
     monkeypatch.setattr(SpyderEnvManagerWidget, "get_conf", get_conf)
+    monkeypatch.setattr(cache, "get_cache_dir", lambda: str(tmp_path / "cache"))
 
     SpyderEnvManagerWidget.CONF_SECTION = CONF_SECTION
     widget = SpyderEnvManagerWidget(None, None)
+    qtbot.addWidget(widget)
     widget.setup()
     widget.show()
+
+    # Wait for the environments to be listed and stop the actions thread
+    qtbot.waitUntil(lambda: widget.actions_enabled, timeout=180000)
+    widget.close()
+    assert not widget.env_manager_action_thread.isRunning()
@@ -21,6 +21,7 @@ from qtpy.QtWidgets import QMainWindow
 from spyder.config.manager import CONF
 
 # Local imports
+from spyder_env_manager.spyder import cache
 from spyder_env_manager.spyder.config import CONF_DEFAULTS
 from spyder_env_manager.spyder.plugin import SpyderEnvManager
 from spyder_env_manager.spyder.widgets.main_widget import (
@@ -64,9 +65,10 @@ def spyder_env_manager_conf(tmp_path, qtbot, monkeypatch):
                 _, config_default_values = CONF_DEFAULTS[0]
                 return config_default_values[option]
             except KeyError:
-                return None
+                return default
 
     monkeypatch.setattr(SpyderEnvManagerWidget, "get_conf", get_conf)
+    monkeypatch.setattr(cache, "get_cache_dir", lambda: str(tmp_path / "cache"))
 
     # Setup plugin
     plugin = SpyderEnvManager(parent=window, configuration=CONF)
@@ -99,9 +101,10 @@ def spyder_env_manager(tmp_path, qtbot, monkeypatch):
                 _, config_default_values = CONF_DEFAULTS[0]
                 return config_default_values[option]
             except KeyError:
-                return None
+                return default
 
     monkeypatch.setattr(SpyderEnvManagerWidget, "get_conf", get_conf)
+    monkeypatch.setattr(cache, "get_cache_dir", lambda: str(tmp_path / "cache"))
 
     # Setup plugin
     plugin = SpyderEnvManager(parent=window, configuration=Mock())
@@ -121,17 +124,24 @@ def spyder_env_manager(tmp_path, qtbot, monkeypatch):
 
 # ---- Tests
 # ------------------------------------------------------------------------
-def test_plugin_initial_state(spyder_env_manager):
+def test_plugin_initial_state(spyder_env_manager, qtbot):
     """
     Check plugin initialization and that actions and widgets have the
     correct state when initialized.
     """
     widget = spyder_env_manager.get_widget()
 
+    # Wait for the environments to be listed
+    qtbot.waitUntil(
+        lambda: widget.actions_enabled,
+        timeout=OPERATION_TIMEOUT,
+    )
+
     # Check for widgets initialization
     assert widget.select_environment.currentData() is None
     assert widget.select_environment.isEnabled()
-    assert widget.stack_layout.currentWidget() == widget.infowidget
+    assert widget.infowidget.isVisible()
+    assert not widget.packages_table.isVisible()
 
     # Check widget actions
     disabled_actions_ids = [
@@ -164,7 +174,7 @@ def test_environment_creation_and_deletion(spyder_env_manager, qtbot, caplog):
     widget._message_new_environment()
 
     qtbot.waitUntil(
-        lambda: widget.stack_layout.currentWidget() == widget.packages_table,
+        lambda: widget.packages_table.isVisible(),
         timeout=OPERATION_TIMEOUT,
     )
     assert widget.select_environment.currentText() == "test_env"
@@ -179,7 +189,7 @@ def test_environment_creation_and_deletion(spyder_env_manager, qtbot, caplog):
     )
 
     qtbot.waitUntil(
-        lambda: widget.stack_layout.currentWidget() == widget.infowidget,
+        lambda: widget.infowidget.isVisible(),
         timeout=OPERATION_TIMEOUT,
     )
     assert widget.select_environment.currentData() is None
@@ -200,7 +210,7 @@ def test_environment_import(spyder_env_manager, qtbot, caplog):
     widget._message_import_environment()
 
     qtbot.waitUntil(
-        lambda: widget.stack_layout.currentWidget() == widget.packages_table,
+        lambda: widget.packages_table.isVisible(),
         timeout=OPERATION_TIMEOUT,
     )
     assert widget.select_environment.currentText() == "test_env_import"
@@ -233,7 +243,7 @@ def test_environment_package_installation(spyder_env_manager, qtbot, caplog):
     )
 
     qtbot.waitUntil(
-        lambda: widget.stack_layout.currentWidget() == widget.packages_table,
+        lambda: widget.packages_table.isVisible(),
         timeout=OPERATION_TIMEOUT,
     )
     assert widget.select_environment.currentText() == "test_env"
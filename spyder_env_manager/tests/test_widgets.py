@@ -7,3 +7,72 @@
 """
 Spyder Env Manager widget tests.
 """
+# Local imports
+from spyder_env_manager.spyder.widgets.helper_widgets import (
+    CustomParametersDialog,
+    CustomParametersDialogWidgets,
+)
+from spyder_env_manager.spyder.widgets.packages_table import EnvironmentPackagesTable
+from spyder_env_manager.spyder.workers import packages_to_columns
+
+
+def test_packages_table_load_packages(qtbot):
+    """Test loading packages by columns and filtering the requested ones."""
+    packages = [
+        {
+            "name": "python",
+            "version": "3.10.9",
+            "description": "",
+            "requested": True,
+        },
+        {
+            "name": "pip",
+            "version": "23.0",
+            "description": "",
+            "requested": False,
+        },
+        {
+            "name": "packaging",
+            "version": "22.0",
+            "description": "",
+            "requested": True,
+        },
+    ]
+    table = EnvironmentPackagesTable(None)
+    qtbot.addWidget(table)
+
+    table.load_packages(False, packages_to_columns(packages))
+    assert table.source_model.rowCount() == 3
+    assert table.get_package_info(1)["name"] == "pip"
+    assert not table.get_package_info(1)["requested"]
+
+    table.load_packages(True)
+    assert table.source_model.rowCount() == 2
+    assert table.get_package_info(1)["name"] == "packaging"
+    assert table.get_package_info(1)["version"] == "22.0"
+    assert table.get_package_info(1)["requested"]
+
+
+def test_parameters_dialog_reset(qtbot):
+    """Test restoring the initial state of a dialog to reuse it."""
+    types = [
+        CustomParametersDialogWidgets.Label,
+        CustomParametersDialogWidgets.ComboBox,
+        CustomParametersDialogWidgets.LineEditVersion,
+    ]
+    dialog = CustomParametersDialog(
+        None,
+        title="Install package",
+        messages=["Package", "Constraint", "Version"],
+        types=types,
+        contents=[{"numpy"}, ["==", "latest"], {}],
+    )
+    qtbot.addWidget(dialog)
+
+    dialog.combobox.setCurrentIndex(1)
+    dialog.lineedit_version.setText("1.24")
+    dialog.reset([{"scipy"}, ["==", "latest"], {}])
+
+    assert dialog.line_string.text() == "scipy"
+    assert dialog.combobox.currentText() == "=="
+    assert dialog.lineedit_version.text() == ""